@@ -5,41 +5,133 @@ Handles loading and managing configuration from config.ini and environment varia
 
 import os
 import configparser
+from types import SimpleNamespace
 from .defaults import DEFAULT_CONFIG
 
 
+_MISSING = object()
+
+
+def _unescape_newlines(value):
+    """Turn literal \\n sequences from the config file into real newlines"""
+    return value.replace('\\n', '\n')
+
+
+# Conversions applied to raw DEFAULT_CONFIG strings, keyed by getter name
+_DEFAULT_CONVERTERS = {
+    'get': str,
+    'getint': int,
+    'getfloat': float,
+    'getboolean': lambda value: configparser.ConfigParser.BOOLEAN_STATES[value.lower()],
+    'getescnl': _unescape_newlines,
+}
+
+
 class ConfigManager:
     """Manages configuration from config.ini and environment variables"""
     
+    # Shared instances created by instance(), keyed by absolute config file path
+    _instances = {}
+    
+    @classmethod
+    def instance(cls, config_file="config.ini"):
+        """Return the shared ConfigManager for a config file, loading it on first use"""
+        path = os.path.abspath(config_file)
+        manager = cls._instances.get(path)
+        if manager is None:
+            manager = cls._instances[path] = cls(config_file)
+        return manager
+    
+    @classmethod
+    def reset(cls):
+        """Forget all shared instances so the next instance() call reloads from disk"""
+        cls._instances.clear()
+    
     def __init__(self, config_file="config.ini"):
-        self.config = configparser.ConfigParser()
+        self.config = configparser.ConfigParser(converters={'escnl': _unescape_newlines})
         self.config_file = config_file
+        self._cache = {}
         self.load_config()
     
     def load_config(self):
-        """Load configuration from file with defaults"""
-        # Set defaults from the separate defaults file
-        self.config.read_dict(DEFAULT_CONFIG)
+        """Load configuration from file (defaults are resolved lazily on lookup)"""
+        # Drop any values cached from a previous load
+        self._cache.clear()
         
         # Read from config file if it exists
         if os.path.exists(self.config_file):
-            self.config.read(self.config_file, encoding='utf-8')
+            # Read the whole file in one call and parse it from memory
+            with open(self.config_file, 'rb') as f:
+                data = f.read().decode('utf-8')
+            self.config.read_string(data, source=self.config_file)
             print(f"Configuration loaded from {self.config_file}")
         else:
             print(f"Config file {self.config_file} not found, using defaults")
+        
+        self._build_snapshots()
+    
+    def _build_snapshots(self):
+        """Pre-parse frequently used sections into plain attribute namespaces"""
+        self.translation = SimpleNamespace(
+            from_language=self.get('Translation', 'from_language'),
+            to_language=self.get('Translation', 'to_language'),
+            from_language_name=self.get('Translation', 'from_language_name'),
+            to_language_name=self.get('Translation', 'to_language_name')
+        )
+        self.output = SimpleNamespace(
+            obs_file=self.get('Output', 'obs_file'),
+            log_file=self.get('Output', 'log_file'),
+            encoding=self.get('Output', 'encoding'),
+            include_timestamp=self.getboolean('Output', 'include_timestamp'),
+            timestamp_format=self.get('Output', 'timestamp_format'),
+            voice_log_enabled=self.getboolean('Output', 'voice_log_enabled'),
+            voice_log_directory=self.get('Output', 'voice_log_directory'),
+            buffer_lines=self.getint('Output', 'obs_buffer_lines'),
+            auto_clear_timeout=self.getfloat('Output', 'obs_auto_clear_timeout'),
+            expiry_mode=self.get('Output', 'obs_expiry_mode'),
+            line_separator=self.getescnl('Output', 'obs_line_separator')
+        )
+    
+    def _lookup(self, getter, section, key, fallback):
+        """Return a configuration value, parsing it only on first access
+        
+        Values come from the config file first, then DEFAULT_CONFIG, then fallback.
+        """
+        cache_key = (getter, section, key, fallback)
+        value = self._cache.get(cache_key, _MISSING)
+        if value is _MISSING:
+            if self.config.has_option(section, key):
+                value = getattr(self.config, getter)(section, key)
+            else:
+                default = DEFAULT_CONFIG.get(section, {}).get(key)
+                value = fallback if default is None else _DEFAULT_CONVERTERS[getter](default)
+            self._cache[cache_key] = value
+        return value
+    
+    def set(self, section, key, value):
+        """Override a configuration value at runtime"""
+        if not self.config.has_section(section):
+            self.config.add_section(section)
+        self.config.set(section, key, value)
+        self._cache.clear()
+        self._build_snapshots()
     
     def get(self, section, key, fallback=None):
         """Get configuration value with fallback"""
-        return self.config.get(section, key, fallback=fallback)
+        return self._lookup('get', section, key, fallback)
     
     def getboolean(self, section, key, fallback=False):
         """Get boolean configuration value"""
-        return self.config.getboolean(section, key, fallback=fallback)
+        return self._lookup('getboolean', section, key, fallback)
     
     def getint(self, section, key, fallback=0):
         """Get integer configuration value"""
-        return self.config.getint(section, key, fallback=fallback)
+        return self._lookup('getint', section, key, fallback)
     
     def getfloat(self, section, key, fallback=0.0):
         """Get float configuration value"""
-        return self.config.getfloat(section, key, fallback=fallback)
\ No newline at end of file
+        return self._lookup('getfloat', section, key, fallback)
+    
+    def getescnl(self, section, key, fallback=None):
+        """Get string configuration value with \\n escapes turned into newlines"""
+        return self._lookup('getescnl', section, key, fallback)
\ No newline at end of file
@@ -1,6 +1,7 @@
 """
 Default configuration settings for Real-Time Translator
 This file contains all the default configuration values to keep the main code clean
+Values are used as-is (no configparser interpolation), so % does not need escaping
 """
 
 DEFAULT_CONFIG = {
@@ -14,7 +15,8 @@ DEFAULT_CONFIG = {
         'region': 'eastus',
         'endpoint': 'https://api.cognitive.microsofttranslator.com',
         'api_version': '3.0',
-        'timeout': '5'
+        'timeout': '5',
+        'auth_method': 'key'
     },
     'Audio': {
         'ambient_noise_duration': '3',
@@ -23,7 +25,9 @@ DEFAULT_CONFIG = {
         'energy_threshold': '0',
         'dynamic_energy_threshold': 'true',
         'pause_threshold': '1.5',
-        'non_speaking_duration': '0.8'
+        'non_speaking_duration': '0.8',
+        'sample_rate': '16000',
+        'chunk_size': '1024'
     },
     'Output': {
         'obs_file': 'obs_translation.txt',
@@ -31,11 +35,12 @@ DEFAULT_CONFIG = {
         'encoding': 'utf-8',
         'clear_on_start': 'true',
         'include_timestamp': 'false',
-        'timestamp_format': '[%%H:%%M:%%S]',  # Escaped % for configparser
+        'timestamp_format': '[%H:%M:%S]',
         'voice_log_enabled': 'true',
         'voice_log_directory': 'voice_logs',
         'obs_buffer_lines': '3',
         'obs_auto_clear_timeout': '5',
+        'obs_expiry_mode': 'per_line',
         'obs_line_separator': '\\n'
     },
     'Display': {
@@ -49,11 +54,21 @@ DEFAULT_CONFIG = {
     'Performance': {
         'use_background_processing': 'true',
         'max_concurrent_requests': '3',
+        'max_pending_phrases': '6',
         'max_retries': '2',
-        'retry_delay': '1'
+        'retry_delay': '1',
+        'batch_max_items': '25',
+        'batch_max_chars': '5000',
+        'batch_window_ms': '50',
+        'enable_cache': 'true',
+        'cache_size': '2048'
     },
     'Advanced': {
         'recognition_service': 'google',
+        'whisper_model': 'small',
+        'whisper_device': 'auto',
+        'whisper_compute_type': 'auto',
+        'vosk_model_path': '',
         'skip_silence': 'true',
         'silence_threshold': '0.5',
         'debug_mode': 'false',
@@ -4,17 +4,18 @@ Modular version with separate configuration, translation, and logging components
 """
 
 import os
-import sys
-from pathlib import Path
 
-# Add config directory to path
-sys.path.append(str(Path(__file__).parent / "config"))
+# Only import python-dotenv when there is a .env file to load
+ENV_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env')
+if os.path.exists(ENV_FILE):
+    try:
+        from dotenv import load_dotenv
+        load_dotenv(ENV_FILE)
+    except ImportError:
+        pass  # python-dotenv not installed, skip
 
-try:
-    from dotenv import load_dotenv
-    load_dotenv()  # Load .env file if it exists
-except ImportError:
-    pass  # python-dotenv not installed, skip
+# Read the API key once at startup (after .env has been loaded)
+AZURE_TRANSLATOR_KEY = os.environ.get('AZURE_TRANSLATOR_KEY')
 
 from config import ConfigManager
 from translator import RealTimeTranslator
@@ -26,17 +27,14 @@ def show_startup_info(config_manager):
     print("=" * 50)
     
     # Show key configuration
-    from_lang = config_manager.get('Translation', 'from_language_name')
-    to_lang = config_manager.get('Translation', 'to_language_name')
-    obs_file = config_manager.get('Output', 'obs_file')
-    voice_log_enabled = config_manager.getboolean('Output', 'voice_log_enabled')
+    translation = config_manager.translation
+    output = config_manager.output
     
-    print(f"Translation: {from_lang} -> {to_lang}")
-    print(f"OBS Output: {obs_file}")
+    print(f"Translation: {translation.from_language_name} -> {translation.to_language_name}")
+    print(f"OBS Output: {output.obs_file}")
     
-    if voice_log_enabled:
-        voice_dir = config_manager.get('Output', 'voice_log_directory')
-        print(f"Voice Logs: {voice_dir}/ (daily files)")
+    if output.voice_log_enabled:
+        print(f"Voice Logs: {output.voice_log_directory}/ (daily files)")
     else:
         print("Voice Logs: Disabled")
     
@@ -45,7 +43,7 @@ def show_startup_info(config_manager):
 
 def check_azure_key():
     """Check and display Azure API key status"""
-    azure_key = os.getenv('AZURE_TRANSLATOR_KEY')
+    azure_key = AZURE_TRANSLATOR_KEY
     
     if not azure_key:
         print("WARNING: AZURE_TRANSLATOR_KEY not found!")
@@ -68,7 +66,7 @@ def main():
     config = None
     try:
         # Load configuration
-        config = ConfigManager("config.ini")
+        config = ConfigManager.instance("config.ini")
         
         # Show startup information
         show_startup_info(config)
@@ -77,7 +75,7 @@ def main():
         has_api_key = check_azure_key()
         
         # Create and start translator
-        translator = RealTimeTranslator(config)
+        translator = RealTimeTranslator(config, azure_key=AZURE_TRANSLATOR_KEY)
         translator.start()
         
     except KeyboardInterrupt:
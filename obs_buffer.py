@@ -3,33 +3,59 @@ OBS Buffer Manager for Real-Time Translator
 Handles multi-line text buffer with individual line expiry (chat-like behavior)
 """
 
+import os
 import threading
 import time
-from datetime import datetime
 from collections import deque
 
 
 class OBSBufferManager:
     """Manages OBS text buffer with individual line expiry like chat messages"""
     
+    # OBS reads text sources at most once per frame, so faster writes are never seen
+    MIN_WRITE_INTERVAL = 1 / 60
+    
     def __init__(self, config_manager):
         self.config = config_manager
         
-        # Load configuration
-        self.obs_file = self.config.get('Output', 'obs_file')
-        self.encoding = self.config.get('Output', 'encoding')
-        self.buffer_lines = self.config.getint('Output', 'obs_buffer_lines')
-        self.line_timeout = self.config.getfloat('Output', 'obs_auto_clear_timeout')
-        self.line_separator = self.config.get('Output', 'obs_line_separator').replace('\\n', '\n')
-        self.include_timestamp = self.config.getboolean('Output', 'include_timestamp')
-        self.timestamp_format = self.config.get('Output', 'timestamp_format')
+        # Load configuration from the pre-parsed Output snapshot
+        output = self.config.output
+        self.obs_file = output.obs_file
+        self.encoding = output.encoding
+        self.buffer_lines = output.buffer_lines
+        self.line_timeout = output.auto_clear_timeout
+        self.line_separator = output.line_separator
+        self.include_timestamp = output.include_timestamp
+        self.timestamp_format = output.timestamp_format
+        self.expiry_mode = output.expiry_mode
+        
+        # Deadlines follow the oldest line (per_line) or the newest one (global)
+        self._deadline_index = -1 if self.expiry_mode == 'global' else 0
         
-        # Buffer state - stores tuples of (text, timestamp)
-        self.text_buffer = deque(maxlen=self.buffer_lines)
+        # Pick the line formatter once instead of branching on every add_text
+        self._format_line = self._format_timestamped if self.include_timestamp else self._format_plain
+        
+        # Buffer state - encoded lines and their expiry timestamps in parallel deques
+        # (both bounded, so they always drop the same oldest entry together)
+        self._lines = deque(maxlen=self.buffer_lines)
+        self._timestamps = deque(maxlen=self.buffer_lines)
         self.lock = threading.Lock()
         self.cleanup_thread = None
         self.running = True
         
+        # Pending changes are written by the background thread, which waits on
+        # this condition until new text arrives or the next line's deadline passes
+        self._dirty = False
+        self._changed = threading.Condition(self.lock)
+        
+        # Lines are encoded once when added and written as raw bytes
+        self._separator_bytes = self.line_separator.encode(self.encoding)
+        
+        # Updates are written to a temp file and swapped in atomically
+        self._tmp_file = self.obs_file + '.tmp'
+        self._last_written = None
+        self._last_write_time = 0.0
+        
         # Initialize with empty file
         self.write_buffer_to_file()
         
@@ -42,77 +68,126 @@ class OBSBufferManager:
         self.cleanup_thread.start()
     
     def cleanup_expired_lines(self):
-        """Continuously remove expired lines (runs in background thread)"""
-        while self.running:
-            time.sleep(0.5)  # Check every 500ms
-            
-            with self.lock:
-                current_time = time.time()
-                # Remove lines that have exceeded their timeout
-                expired_count = 0
-                
-                # Create new buffer without expired lines
-                new_buffer = deque(maxlen=self.buffer_lines)
-                for text, timestamp in self.text_buffer:
-                    if current_time - timestamp < self.line_timeout:
-                        new_buffer.append((text, timestamp))
-                    else:
-                        expired_count += 1
+        """Remove expired lines and write pending changes (runs in background thread)
+        
+        Sleeps until the next expiry deadline or until new text arrives,
+        so an idle buffer causes no wakeups at all. Bursts of new text are
+        coalesced into at most one write per MIN_WRITE_INTERVAL.
+        """
+        with self._changed:
+            while self.running:
+                if self._expire_lines(time.monotonic()) > 0:
+                    self._dirty = True
                 
-                # Update buffer if any lines expired
-                if expired_count > 0:
-                    self.text_buffer = new_buffer
+                # Write file if anything changed since the last write
+                if self._dirty:
+                    delay = self._last_write_time + self.MIN_WRITE_INTERVAL - time.monotonic()
+                    if delay > 0:
+                        # Too soon after the last write: let more text accumulate first
+                        self._changed.wait(delay)
+                        continue
                     self.write_buffer_to_file()
+                
+                # Sleep until the next deadline (or indefinitely if empty)
+                if self._timestamps:
+                    deadline = self._timestamps[self._deadline_index] + self.line_timeout
+                    wait_time = max(0, deadline - time.monotonic())
+                else:
+                    wait_time = None
+                self._changed.wait_for(lambda: self._dirty or not self.running, wait_time)
+    
+    def _expire_lines(self, current_time):
+        """Remove expired lines according to the expiry mode and return how many were removed"""
+        if self.expiry_mode == 'global':
+            # The whole buffer clears once the newest line has timed out
+            if self._timestamps and current_time - self._timestamps[-1] >= self.line_timeout:
+                expired_count = len(self._lines)
+                self._lines.clear()
+                self._timestamps.clear()
+                return expired_count
+            return 0
+        
+        # Lines are appended in time order, so expired ones are always at the left
+        expired_count = 0
+        while self._timestamps and current_time - self._timestamps[0] >= self.line_timeout:
+            self._timestamps.popleft()
+            self._lines.popleft()
+            expired_count += 1
+        return expired_count
     
     def add_text(self, text):
         """Add new text to the buffer with timestamp"""
-        if not text or not text.strip():
+        if not text or text.isspace():
             return
-            
+        
+        line = self._format_line(text).encode(self.encoding)
+        
         with self.lock:
-            # Add timestamp if configured for display
-            if self.include_timestamp:
-                display_timestamp = datetime.now().strftime(self.timestamp_format)
-                formatted_text = f"{display_timestamp} {text}"
-            else:
-                formatted_text = text
-            
             # Add to buffer with current time for expiry tracking
-            current_time = time.time()
-            self.text_buffer.append((formatted_text, current_time))
+            self._lines.append(line)
+            self._timestamps.append(time.monotonic())
+            self._dirty = True
             
-            # Write to file immediately
-            self.write_buffer_to_file()
+            # Wake the background thread to write the file
+            self._changed.notify()
+    
+    def _format_plain(self, text):
+        """Format a line without a display timestamp"""
+        return text
+    
+    def _format_timestamped(self, text):
+        """Format a line with the configured display timestamp"""
+        return f"{time.strftime(self.timestamp_format)} {text}"
     
     def write_buffer_to_file(self):
         """Write current buffer to OBS file (only the text, not timestamps)"""
         try:
-            # Extract only the text from (text, timestamp) tuples
-            texts = [item[0] for item in self.text_buffer]
-            content = self.line_separator.join(texts)
-            with open(self.obs_file, 'w', encoding=self.encoding) as f:
-                f.write(content)
+            content = self._separator_bytes.join(self._lines)
+            self._dirty = False
+            
+            # Skip the write if OBS already shows this exact content
+            if content == self._last_written:
+                return
+            
+            self._replace_file(content)
+            self._last_written = content
+            self._last_write_time = time.monotonic()
         except Exception as e:
             print(f"Error writing OBS buffer: {e}")
     
+    def _replace_file(self, content):
+        """Replace the OBS file atomically so OBS never reads a truncated file"""
+        with open(self._tmp_file, 'wb') as f:
+            f.write(content)
+        try:
+            os.replace(self._tmp_file, self.obs_file)
+        except PermissionError:
+            # Windows refuses to replace a file another process has open,
+            # so fall back to rewriting it in place
+            os.remove(self._tmp_file)
+            with open(self.obs_file, 'wb') as f:
+                f.write(content)
+    
     def clear_buffer(self):
         """Clear the text buffer"""
         with self.lock:
-            self.text_buffer.clear()
+            self._lines.clear()
+            self._timestamps.clear()
             self.write_buffer_to_file()
     
     def get_buffer_info(self):
-        """Get current buffer information"""
-        with self.lock:
-            return {
-                'lines': len(self.text_buffer),
-                'max_lines': self.buffer_lines,
-                'line_timeout': self.line_timeout
-            }
+        """Get current buffer information (lock-free: values are only used for display)"""
+        return {
+            'lines': len(self._lines),
+            'max_lines': self.buffer_lines,
+            'line_timeout': self.line_timeout
+        }
     
     def cleanup(self):
         """Clean up resources"""
-        self.running = False
+        with self.lock:
+            self.running = False
+            self._changed.notify()
         if self.cleanup_thread and self.cleanup_thread.is_alive():
             self.cleanup_thread.join(timeout=1)
         self.clear_buffer()
\ No newline at end of file
@@ -6,7 +6,8 @@ This script demonstrates different language configurations
 
 import os
 import sys
-sys.path.append('.')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 from main import ConfigManager, RealTimeTranslator
 
 def demo_configurations():
@@ -46,10 +47,10 @@ def demo_configurations():
         config_manager = ConfigManager()
         
         # Override language settings
-        config_manager.config.set('Translation', 'from_language', config_demo['from_lang'])
-        config_manager.config.set('Translation', 'to_language', config_demo['to_lang'])
-        config_manager.config.set('Translation', 'from_language_name', config_demo['from_name'])
-        config_manager.config.set('Translation', 'to_language_name', config_demo['to_name'])
+        config_manager.set('Translation', 'from_language', config_demo['from_lang'])
+        config_manager.set('Translation', 'to_language', config_demo['to_lang'])
+        config_manager.set('Translation', 'from_language_name', config_demo['from_name'])
+        config_manager.set('Translation', 'to_language_name', config_demo['to_name'])
         
         # Create translator (without starting it)
         translator = RealTimeTranslator(config_manager)
@@ -69,7 +70,7 @@ def show_current_config():
     print("\n🔧 Current Configuration")
     print("=" * 50)
     
-    config = ConfigManager()
+    config = ConfigManager.instance()
     
     sections = ['Translation', 'Azure', 'Audio', 'Output', 'Display']
     
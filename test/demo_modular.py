@@ -19,7 +19,7 @@ def demo_voice_logging():
     print("=" * 30)
     
     # Create config and voice logger
-    config = ConfigManager()
+    config = ConfigManager.instance()
     voice_logger = VoiceLogger(config)
     
     # Test phrases
@@ -69,7 +69,7 @@ def demo_configuration():
     print("\n⚙️  Configuration Demo")
     print("=" * 30)
     
-    config = ConfigManager()
+    config = ConfigManager.instance()
     
     # Show key settings
     settings = [
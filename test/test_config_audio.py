@@ -4,7 +4,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import ConfigManager
 
-cm = ConfigManager()
+cm = ConfigManager.instance()
 print('Config loaded successfully')
 print(f'Pause threshold: {cm.getfloat("Audio", "pause_threshold")}s')
 print(f'Non-speaking duration: {cm.getfloat("Audio", "non_speaking_duration")}s')
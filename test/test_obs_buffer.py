@@ -15,7 +15,7 @@ def test_chat_like_buffer():
     print("=" * 50)
     
     # Create buffer
-    config = ConfigManager()
+    config = ConfigManager.instance()
     buffer = OBSBufferManager(config)
     
     info = buffer.get_buffer_info()
@@ -34,19 +34,20 @@ def test_chat_like_buffer():
     for i, msg in enumerate(messages, 1):
         print(f"  [{i}] Adding: {msg}")
         buffer.add_text(msg)
+        time.sleep(0.1)  # Let the background thread write the file
         
         # Show current buffer
-        with open(config.get('Output', 'obs_file'), 'r') as f:
+        with open(config.output.obs_file, 'r') as f:
             content = f.read()
             line_count = len([l for l in content.split('\n') if l.strip()])
             print(f"      Current lines in file: {line_count}")
         
-        time.sleep(2)
+        time.sleep(1.9)
     
     print("\nWaiting 6 seconds to see lines expire...")
     time.sleep(6)
     
-    with open(config.get('Output', 'obs_file'), 'r') as f:
+    with open(config.output.obs_file, 'r') as f:
         content = f.read()
         remaining_lines = len([l for l in content.split('\n') if l.strip()])
         print(f"Lines remaining after expiry: {remaining_lines}")
@@ -0,0 +1,147 @@
+"""
+Test the translation batcher (concurrent phrases share one request)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import threading
+import time
+from translation_batcher import TranslationBatcher
+
+def test_batching():
+    print("Testing translation batcher")
+    print("=" * 50)
+    
+    requests_sent = []
+    
+    def fake_translate_batch(texts):
+        # Simulate a slow network round trip so later phrases queue up
+        requests_sent.append(list(texts))
+        time.sleep(0.2)
+        return [text.upper() for text in texts]
+    
+    batcher = TranslationBatcher(fake_translate_batch, max_items=10, max_chars=5000)
+    
+    phrases = [f"phrase {i}" for i in range(1, 6)]
+    results = {}
+    
+    def translate(phrase):
+        results[phrase] = batcher.submit(phrase).result()
+    
+    threads = [threading.Thread(target=translate, args=(phrase,)) for phrase in phrases]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.01)
+    for thread in threads:
+        thread.join()
+    
+    print(f"Phrases translated: {len(results)}")
+    print(f"Requests sent: {len(requests_sent)}")
+    for i, batch in enumerate(requests_sent, 1):
+        print(f"  Request {i}: {batch}")
+    
+    assert all(results[phrase] == phrase.upper() for phrase in phrases)
+    assert len(requests_sent) < len(phrases)
+    
+    batcher.close()
+    print("\nTest complete!")
+
+def test_batch_window():
+    print("\nTesting batch window")
+    print("=" * 50)
+    
+    requests_sent = []
+    
+    def fake_translate_batch(texts):
+        requests_sent.append(list(texts))
+        return [text.upper() for text in texts]
+    
+    batcher = TranslationBatcher(fake_translate_batch, window=0.2)
+    
+    # Phrases arriving within the window share the first phrase's request
+    futures = []
+    for i in range(1, 4):
+        futures.append(batcher.submit(f"phrase {i}"))
+        time.sleep(0.02)
+    
+    assert [future.result() for future in futures] == ["PHRASE 1", "PHRASE 2", "PHRASE 3"]
+    print(f"Requests sent: {requests_sent}")
+    assert len(requests_sent) == 1
+    
+    batcher.close()
+    print("\nTest complete!")
+
+def test_close_during_window():
+    print("\nTesting close during batch window")
+    print("=" * 50)
+    
+    requests_sent = []
+    
+    def fake_translate_batch(texts):
+        requests_sent.append(list(texts))
+        return [text.upper() for text in texts]
+    
+    batcher = TranslationBatcher(fake_translate_batch, window=0.3)
+    
+    # Closing while the first phrase's window is still open must not lose the stop signal
+    future = batcher.submit("phrase 1")
+    time.sleep(0.05)
+    start = time.monotonic()
+    batcher.close()
+    elapsed = time.monotonic() - start
+    
+    print(f"close() took {elapsed:.2f}s")
+    assert future.result(timeout=1) == "PHRASE 1"
+    assert not batcher.worker.is_alive()
+    assert elapsed < 0.9
+    
+    # Anything submitted after close fails at once instead of waiting forever
+    late = batcher.submit("phrase 2")
+    assert isinstance(late.exception(timeout=0), RuntimeError)
+    assert requests_sent == [["phrase 1"]]
+    
+    print("\nTest complete!")
+
+class FakeHTTPError(Exception):
+    pass
+
+def test_failed_batches():
+    print("\nTesting failed batches")
+    print("=" * 50)
+    
+    requests_sent = []
+    
+    def fake_translate_batch(texts):
+        requests_sent.append(list(texts))
+        if "bad" in texts:
+            raise FakeHTTPError("HTTP 400")
+        if "offline" in texts:
+            raise ConnectionError("connection refused")
+        return [text.upper() for text in texts]
+    
+    batcher = TranslationBatcher(fake_translate_batch, window=0.2, split_on=(FakeHTTPError,))
+    
+    # An error response splits the batch, so only the bad text fails
+    futures = [batcher.submit(text) for text in ["good 1", "bad", "good 2"]]
+    assert futures[0].result(timeout=1) == "GOOD 1"
+    assert isinstance(futures[1].exception(timeout=1), FakeHTTPError)
+    assert futures[2].result(timeout=1) == "GOOD 2"
+    assert len(requests_sent) == 4
+    
+    # A connection error fails the whole batch at once, without per-text retries
+    requests_sent.clear()
+    futures = [batcher.submit(text) for text in ["offline", "good 3", "good 4"]]
+    assert all(isinstance(future.exception(timeout=1), ConnectionError) for future in futures)
+    print(f"Requests sent: {requests_sent}")
+    assert len(requests_sent) == 1
+    
+    batcher.close()
+    print("\nTest complete!")
+
+if __name__ == "__main__":
+    test_batching()
+    test_batch_window()
+    test_close_during_window()
+    test_failed_batches()
@@ -0,0 +1,150 @@
+"""
+Translation Batcher for Real-Time Translator
+Coalesces concurrent translation requests into batched Azure Translator calls
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+# Marks an empty carry slot (None can't be used: it is the stop signal)
+_NO_CARRY = object()
+
+
+class TranslationBatcher:
+    """Groups queued texts into one batched translation request per round trip"""
+    
+    def __init__(self, translate_batch, max_items=25, max_chars=5000, window=0.05, split_on=()):
+        # translate_batch takes a list of texts and returns their translations in order
+        self.translate_batch = translate_batch
+        
+        # Errors that may be caused by a single bad text (e.g. HTTP 400 responses);
+        # a batch failing with one of these is retried text by text, any other
+        # error (connection failure, timeout) fails the whole batch at once
+        self.split_on = tuple(split_on)
+        self.max_items = max_items
+        self.max_chars = max_chars
+        self.window = window  # Seconds to wait for more texts after the first one
+        
+        self.queue = queue.Queue()
+        self._carry = _NO_CARRY  # Item (or stop signal) left over from the previous batch
+        self._closed = False
+        
+        # Single worker thread sends the batches
+        self.worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self.worker.start()
+    
+    def submit(self, text):
+        """Queue text for translation and return a Future for the translated text"""
+        future = Future()
+        if self._closed:
+            # No worker is left to resolve it
+            future.set_exception(RuntimeError("batcher closed"))
+            return future
+        self.queue.put((text, future))
+        return future
+    
+    def _next_item(self, timeout=None):
+        """Get the next queued item, starting with any carried-over item
+        
+        Waits indefinitely when timeout is None; raises queue.Empty once it runs out.
+        """
+        if self._carry is not _NO_CARRY:
+            item, self._carry = self._carry, _NO_CARRY
+            return item
+        if timeout is None:
+            return self.queue.get()
+        if timeout <= 0:
+            return self.queue.get_nowait()
+        return self.queue.get(timeout=timeout)
+    
+    def _collect_batch(self):
+        """Wait for the first item, then add whatever else arrives within the batch window
+        
+        Returns None when the batcher has been closed.
+        """
+        item = self._next_item()
+        if item is None:
+            return None
+        
+        batch = [item]
+        chars = len(item[0])
+        deadline = time.monotonic() + self.window
+        while len(batch) < self.max_items:
+            try:
+                item = self._next_item(timeout=deadline - time.monotonic())
+            except queue.Empty:
+                break
+            
+            # Keep the stop signal or an oversized item for the next round
+            if item is None or chars + len(item[0]) > self.max_chars:
+                self._carry = item
+                break
+            
+            batch.append(item)
+            chars += len(item[0])
+        
+        return batch
+    
+    def _dispatch(self, batch):
+        """Translate a batch and resolve each item's future"""
+        texts = [text for text, _ in batch]
+        try:
+            results = self.translate_batch(texts)
+        except self.split_on as e:
+            self._dispatch_individually(batch, e)
+            return
+        except Exception as e:
+            # Retrying each text would only repeat the same failure
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        
+        if len(results) != len(texts):
+            self._dispatch_individually(
+                batch, ValueError(f"Expected {len(texts)} translations, got {len(results)}"))
+            return
+        
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+    
+    def _dispatch_individually(self, batch, error):
+        """Retry a failed batch one text at a time so one bad text doesn't fail the others"""
+        if len(batch) == 1:
+            batch[0][1].set_exception(error)
+            return
+        
+        for index, (text, future) in enumerate(batch):
+            try:
+                future.set_result(self.translate_batch([text])[0])
+            except self.split_on as item_error:
+                future.set_exception(item_error)
+            except Exception as item_error:
+                # Not specific to this text: fail the rest without more requests
+                for _, remaining in batch[index:]:
+                    remaining.set_exception(item_error)
+                return
+    
+    def _worker_loop(self):
+        """Send batches until closed (runs in background thread)"""
+        while True:
+            batch = self._collect_batch()
+            if batch is None:
+                break
+            self._dispatch(batch)
+        
+        # Cancel anything still waiting after shutdown
+        while True:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item[1].cancel()
+    
+    def close(self):
+        """Stop the worker thread once the batches already collected are sent"""
+        self._closed = True
+        self.queue.put(None)
+        self.worker.join(timeout=1)
\ No newline at end of file
@@ -5,15 +5,23 @@ Handles speech recognition, translation, and file output
 
 import speech_recognition as sr
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import time
 import threading
 import os
 import uuid
+import itertools
 import io
-from datetime import datetime
+import random
+import queue
+import re
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from voice_logger import VoiceLogger
 from obs_buffer import OBSBufferManager
+from translation_batcher import TranslationBatcher
 
 # NLTK imports for punctuation and sentence tokenization
 try:
@@ -37,11 +45,39 @@ except ImportError:
     NLTK_AVAILABLE = False
 
 # Whisper imports (for better speech recognition, especially for French)
+# faster-whisper (CTranslate2, int8 kernels) is preferred over the reference openai-whisper
+try:
+    from faster_whisper import WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
 try:
     import whisper
     WHISPER_AVAILABLE = True
 except ImportError:
-    WHISPER_AVAILABLE = False
+    WHISPER_AVAILABLE = FASTER_WHISPER_AVAILABLE
+
+# Vosk imports (offline on-device recognition, no network round trip)
+try:
+    import vosk
+    VOSK_AVAILABLE = True
+except ImportError:
+    VOSK_AVAILABLE = False
+
+# orjson for faster Azure and Vosk JSON handling (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Azure Speech SDK (streaming recognition over a single persistent connection)
+try:
+    import azure.cognitiveservices.speech as speechsdk
+    AZURE_SPEECH_AVAILABLE = True
+except ImportError:
+    AZURE_SPEECH_AVAILABLE = False
 
 # PyAudio for audio handling with Whisper
 try:
@@ -50,25 +86,136 @@ try:
 except ImportError:
     NUMPY_AVAILABLE = False
 
+# Regional locale used for speech recognition of each language code
+# (plain "xx-XX" is wrong for several languages, e.g. en-EN or ja-JA)
+RECOGNITION_LOCALES = {
+    'ar': 'ar-SA', 'de': 'de-DE', 'en': 'en-US', 'es': 'es-ES',
+    'fr': 'fr-FR', 'hi': 'hi-IN', 'it': 'it-IT', 'ja': 'ja-JP',
+    'ko': 'ko-KR', 'nl': 'nl-NL', 'pl': 'pl-PL', 'pt': 'pt-BR',
+    'ru': 'ru-RU', 'sv': 'sv-SE', 'tr': 'tr-TR', 'uk': 'uk-UA',
+    'zh': 'zh-CN', 'zh-Hans': 'zh-CN', 'zh-Hant': 'zh-TW'
+}
+
+
+def punctuation_rule(question_starts, emphatic_words):
+    """Compile a language's (question start, emphatic word) regexes for restore_punctuation"""
+    return (
+        re.compile(r'(?:%s)\b' % '|'.join(question_starts), re.IGNORECASE),
+        re.compile(r'\b(?:%s)\b' % '|'.join(emphatic_words), re.IGNORECASE)
+    )
+
+
+# Punctuation heuristics per source language, compiled once instead of scanning
+# word lists per phrase (languages not listed use the English rules)
+PUNCTUATION_RULES = {
+    'en': punctuation_rule(
+        ['what', 'when', 'where', 'who', 'why', 'how', 'is', 'are', 'do', 'does', 'can',
+         'could', 'will', 'would', 'should', 'have', 'has', 'did'],
+        ['wow', 'excellent', 'amazing', 'incredible', 'unbelievable']
+    ),
+    'fr': punctuation_rule(
+        ["qu'est-ce", 'est-ce', 'pourquoi', 'comment', 'quand', 'où', 'qui', 'quoi',
+         'quel', 'quelle', 'quels', 'quelles', 'combien'],
+        ['incroyable', 'génial', 'magnifique', 'excellent', 'extraordinaire', 'waouh']
+    ),
+    'es': punctuation_rule(
+        ['qué', 'cómo', 'dónde', 'cuándo', 'por qué', 'quién', 'quiénes', 'cuál', 'cuáles',
+         'cuánto', 'cuánta', 'cuántos', 'cuántas'],
+        ['increíble', 'genial', 'excelente', 'impresionante', 'guau']
+    ),
+    'de': punctuation_rule(
+        ['was', 'wann', 'wo', 'wer', 'warum', 'wieso', 'weshalb', 'wie', 'welche', 'welcher',
+         'welches', 'ist', 'sind', 'hast', 'hat', 'haben', 'bist', 'kann', 'kannst', 'können'],
+        ['wow', 'toll', 'unglaublich', 'fantastisch', 'wahnsinn']
+    ),
+    'it': punctuation_rule(
+        ['cosa', 'che cosa', 'quando', 'dove', 'chi', 'perché', 'come', 'quale', 'quali', 'quanto'],
+        ['incredibile', 'fantastico', 'eccellente', 'magnifico', 'wow']
+    ),
+    'pt': punctuation_rule(
+        ['o que', 'quando', 'onde', 'quem', 'por que', 'como', 'qual', 'quais', 'quanto'],
+        ['incrível', 'excelente', 'fantástico', 'uau', 'nossa']
+    ),
+}
+
+# Recognition noise markers, removed in one pass (whole words only, so "musical" is kept)
+NOISE_RE = re.compile(
+    r'(?<!\w)(?:inaudible|music|\[background noise\]|\[silence\]|\[cough\])(?!\w)',
+    re.IGNORECASE
+)
+
+
+def recognition_locale(language):
+    """Map a translator language code to the locale expected by speech recognizers"""
+    if language in RECOGNITION_LOCALES:
+        return RECOGNITION_LOCALES[language]
+    if '-' in language:
+        return language  # Already a full locale
+    return f"{language}-{language.upper()}"
+
+
+# Vosk model language names that differ from the translator language code
+# (other codes, e.g. fr, de, es, ru, are used by vosk as they are)
+VOSK_LANGUAGES = {
+    'en': 'en-us', 'zh': 'cn', 'zh-Hans': 'cn', 'zh-Hant': 'cn',
+    'vi': 'vn', 'el': 'el-gr', 'kk': 'kz', 'tl': 'ph', 'fil': 'ph'
+}
+
+
+def vosk_language(language):
+    """Map a translator language code to the model language name vosk downloads"""
+    return VOSK_LANGUAGES.get(language, language.split('-')[0].lower())
+
+
+class TextRejectedError(requests.HTTPError):
+    """Azure rejected the request content (400 or 413), possibly because of a single text"""
+
+
+# Statuses worth retrying a batch text by text; throttling (429), auth and
+# server errors would only fail again once per text
+TEXT_REJECTED_STATUSES = (400, 413)
+
 
 class RealTimeTranslator:
-    def __init__(self, config_manager):
+    # Bounds (seconds) for the listen loop's exponential error backoff
+    MIN_ERROR_BACKOFF = 0.05
+    MAX_ERROR_BACKOFF = 1.6
+    
+    # Azure access tokens are valid for 10 minutes; refresh a little earlier
+    TOKEN_LIFETIME = 540
+    
+    # Whisper and Vosk models expect 16 kHz mono audio
+    WHISPER_SAMPLE_RATE = 16000
+    VOSK_SAMPLE_RATE = 16000
+    
+    # How much of the previous phrase is passed to Whisper as context
+    WHISPER_PROMPT_CHARS = 200
+    
+    def __init__(self, config_manager, azure_key=None):
         self.config = config_manager
         
-        # Load Azure key from environment (prioritize .env, then system env)
-        self.azure_key = os.getenv('AZURE_TRANSLATOR_KEY')
+        # Use the key passed by the caller, otherwise read it from the environment
+        self.azure_key = azure_key if azure_key is not None else os.getenv('AZURE_TRANSLATOR_KEY')
         
         # Load configuration
         self.azure_region = self.config.get('Azure', 'region')
         self.azure_endpoint = self.config.get('Azure', 'endpoint')
         self.api_version = self.config.get('Azure', 'api_version')
         self.timeout = self.config.getint('Azure', 'timeout')
+        self.use_token_auth = self.config.get('Azure', 'auth_method').lower() == 'token'
         
         # Translation settings
         self.from_lang = self.config.get('Translation', 'from_language')
         self.to_lang = self.config.get('Translation', 'to_language')
         self.from_lang_name = self.config.get('Translation', 'from_language_name')
         self.to_lang_name = self.config.get('Translation', 'to_language_name')
+        self.recognition_lang = recognition_locale(self.from_lang)
+        
+        # Punctuation rules for the source language (NLTK tagging is English-only)
+        source_language = self.from_lang.split('-')[0].lower()
+        self._question_start_re, self._emphatic_word_re = PUNCTUATION_RULES.get(
+            source_language, PUNCTUATION_RULES['en'])
+        self._use_pos_tagger = NLTK_AVAILABLE and source_language == 'en'
         
         # Audio settings
         self.ambient_duration = self.config.getfloat('Audio', 'ambient_noise_duration')
@@ -78,14 +225,14 @@ class RealTimeTranslator:
         self.dynamic_energy = self.config.getboolean('Audio', 'dynamic_energy_threshold')
         self.pause_threshold = self.config.getfloat('Audio', 'pause_threshold')
         self.non_speaking_duration = self.config.getfloat('Audio', 'non_speaking_duration')
+        self.sample_rate = self.config.getint('Audio', 'sample_rate')
+        self.chunk_size = self.config.getint('Audio', 'chunk_size')
         
         # Output settings
         self.output_file = self.config.get('Output', 'obs_file')
         self.log_file = self.config.get('Output', 'log_file')
         self.encoding = self.config.get('Output', 'encoding')
         self.clear_on_start = self.config.getboolean('Output', 'clear_on_start')
-        self.include_timestamp = self.config.getboolean('Output', 'include_timestamp')
-        self.timestamp_format = self.config.get('Output', 'timestamp_format')
         
         # Display settings
         self.show_original = self.config.getboolean('Display', 'show_original')
@@ -98,11 +245,122 @@ class RealTimeTranslator:
         self.fallback_mode = self.config.get('Advanced', 'fallback_mode')
         self.recognition_service = self.config.get('Advanced', 'recognition_service')
         
+        # Performance settings
+        self.max_concurrent_requests = self.config.getint('Performance', 'max_concurrent_requests')
+        self.max_retries = self.config.getint('Performance', 'max_retries')
+        
+        # Longest a phrase waits for its translation: every attempt of its request
+        # plus one batch window, so an outage never blocks the output thread for long
+        self._result_timeout = self.timeout * (self.max_retries + 1) + 1
+        self.max_pending_phrases = self.config.getint('Performance', 'max_pending_phrases')
+        self.use_background_processing = self.config.getboolean('Performance', 'use_background_processing')
+        
+        # Reusable worker threads for background processing of captured phrases
+        self._pool = ThreadPoolExecutor(max_workers=max(self.max_concurrent_requests, 1),
+                                        thread_name_prefix='xlate')
+        
+        # Phrases waiting for a worker; when full, appending drops the oldest one
+        self._pending_items = deque(maxlen=max(self.max_pending_phrases, 1))
+        self._pending_lock = threading.Lock()
+        
+        # Persistent HTTP session so translations reuse the Azure connection
+        self.http = self._create_http_session()
+        
+        # Trace ids (debug mode) share a random per-session prefix and end in a
+        # counter, so each request needs no fresh uuid4 from the OS
+        self._trace_prefix = uuid.uuid4().hex[:24]
+        self._trace_counter = itertools.count()
+        
+        # Cached bearer token (auth_method = token), shared by all worker threads
+        self._token = None
+        self._token_exp = 0
+        self._token_lock = threading.Lock()
+        self._token_url = f"https://{self.azure_region}.api.cognitive.microsoft.com/sts/v1.0/issueToken"
+        
+        # Request URL and query parameters never change during a session
+        self._translate_url = self.azure_endpoint.rstrip('/') + '/translate'
+        self._translate_params = {
+            'api-version': self.api_version,
+            'from': self.from_lang,
+            'to': [self.to_lang]
+        }
+        
+        # Bounded LRU cache of recent translations, keyed on language pair and normalized text
+        self.enable_cache = self.config.getboolean('Performance', 'enable_cache')
+        self.cache_size = self.config.getint('Performance', 'cache_size')
+        self._translation_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # Batch concurrent translations into a single Azure request
+        self.batcher = TranslationBatcher(
+            self._translate_batch,
+            max_items=self.config.getint('Performance', 'batch_max_items'),
+            max_chars=self.config.getint('Performance', 'batch_max_chars'),
+            window=self.config.getint('Performance', 'batch_window_ms') / 1000,
+            split_on=(TextRejectedError,)
+        )
+        
+        # Pick the translation path once instead of checking key and cache settings per phrase
+        # (each path returns a Future so several phrases can be in flight at once)
+        if self.from_lang == self.to_lang:
+            self._translate_async = self._completed  # Nothing to translate
+        elif not self.azure_key:
+            self._translate_async = self._translate_without_key
+        elif self.enable_cache:
+            self._translate_async = self._translate_cached
+        else:
+            self._translate_async = self._request_translation
+        
+        # Translations are started as soon as a phrase is recognized and written in
+        # order by a dedicated thread, so recognition of the next phrase never waits on Azure
+        self._text_q = queue.Queue(maxsize=32)
+        self._translation_thread = threading.Thread(target=self._translation_worker, daemon=True)
+        self._translation_thread.start()
+        
         # Whisper settings (if using Whisper for recognition)
         if self.recognition_service == 'whisper':
             self.whisper_model = self.config.get('Advanced', 'whisper_model')
-            self.whisper_device = self.config.get('Advanced', 'whisper_device')
-            self.whisper_processor = None  # Will be loaded on first use
+            self.whisper_device = self.resolve_whisper_device(self.config.get('Advanced', 'whisper_device'))
+            self.whisper_compute_type = self.config.get('Advanced', 'whisper_compute_type')
+            if self.whisper_compute_type == 'auto':
+                # Quantized weights on CPU, fp16 activations on GPU
+                self.whisper_compute_type = 'int8' if self.whisper_device == 'cpu' else 'int8_float16'
+            self.whisper_processor = None  # Loaded by the warm-up thread or on first use
+            self._whisper_lock = threading.Lock()
+            self._whisper_prompt = None  # Previous phrase, carried over as context
+            
+            # Reused sample buffer (30s of audio, grown if a longer phrase arrives);
+            # the lock also keeps one transcription at a time on the shared model
+            self._pcm_buf = None
+            self._pcm_lock = threading.Lock()
+        
+        # Vosk settings (if using offline Vosk recognition)
+        if self.recognition_service == 'vosk':
+            self.vosk_model_path = self.config.get('Advanced', 'vosk_model_path')
+            self.vosk_model = None  # Loaded by the warm-up thread or on first use
+            self._vosk_error = None  # Set when the model cannot be loaded (Google is used instead)
+            self._vosk_lock = threading.Lock()
+            if not VOSK_AVAILABLE:
+                print("Vosk not installed (pip install vosk), using Google recognition")
+        
+        # Azure Speech settings (if using streaming Azure Speech recognition)
+        self.use_azure_speech = False
+        if self.recognition_service == 'azure_speech':
+            self.azure_speech_key = os.getenv('AZURE_SPEECH_KEY')
+            self.azure_speech_region = self.config.get('Azure', 'speech_region', fallback=self.azure_region)
+            if not AZURE_SPEECH_AVAILABLE:
+                print("Azure Speech SDK not installed (pip install azure-cognitiveservices-speech), using Google recognition")
+            elif not self.azure_speech_key:
+                print("AZURE_SPEECH_KEY not set, using Google recognition")
+            else:
+                self.use_azure_speech = True
+        
+        # Keep the translation log open for the session as a raw append-only fd;
+        # each line is a single os.write, which O_APPEND keeps atomic across threads
+        self._log_fd = None
+        self._log_ts = (None, "")  # (second, formatted timestamp) cache
+        if self.log_file:
+            self._log_fd = os.open(self.log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
         
         # Initialize voice logger
         self.voice_logger = VoiceLogger(config_manager)
@@ -112,16 +370,23 @@ class RealTimeTranslator:
         
         # Initialize speech recognition
         self.recognizer = sr.Recognizer()
-        self.microphone = sr.Microphone()
+        # 16 kHz is all the recognizers use, and larger chunks mean fewer
+        # iterations of the per-chunk energy check in listen()
+        self.microphone = sr.Microphone(sample_rate=self.sample_rate or None, chunk_size=self.chunk_size)
         self.is_running = False
         self.last_translation = ""
         
+        # Load NLP and recognition models while the microphone is calibrated,
+        # instead of on the first phrase
+        threading.Thread(target=self._warmup, daemon=True).start()
+        
         # Configure energy threshold
         if self.energy_threshold > 0:
             self.recognizer.energy_threshold = self.energy_threshold
         
-        # Setup microphone
-        self.setup_microphone()
+        # Setup microphone (Azure Speech captures and segments audio itself)
+        if not self.use_azure_speech:
+            self.setup_microphone()
         
         # Clear output buffer if configured
         if self.clear_on_start:
@@ -133,6 +398,34 @@ class RealTimeTranslator:
         # Show OBS buffer info
         self.show_obs_buffer_info()
     
+    def _create_http_session(self):
+        """Create a keep-alive HTTP session with connection pooling and retries for Azure"""
+        session = requests.Session()
+        
+        # Static headers are sent with every request
+        session.headers.update({'Content-type': 'application/json'})
+        if self.azure_key:
+            session.headers.update({'Ocp-Apim-Subscription-Region': self.azure_region})
+            # With token auth the key is only sent when fetching a token
+            if not self.use_token_auth:
+                session.headers.update({'Ocp-Apim-Subscription-Key': self.azure_key})
+        
+        # Retry transient gateway errors; translation requests are safe to repeat
+        retries = Retry(
+            total=self.max_retries,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset(['POST']),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=max(self.max_concurrent_requests, 1),
+            max_retries=retries
+        )
+        session.mount('https://', adapter)
+        return session
+    
     def show_obs_buffer_info(self):
         """Show information about OBS buffer settings"""
         buffer_info = self.obs_buffer.get_buffer_info()
@@ -146,17 +439,21 @@ class RealTimeTranslator:
         if not text or not text.strip():
             return text
         
-        if not NLTK_AVAILABLE:
-            # Fallback: simple heuristic if NLTK not available
+        text = text.strip()
+        
+        # Check if text already has ending punctuation
+        if text[-1] in '.!?,;:':
+            return text
+        
+        # The first word alone decides most questions, no tagging needed
+        if self._question_start_re.match(text):
+            return text + '?'
+        
+        # The English POS tagger only helps English phrases long enough for word order to matter
+        if not self._use_pos_tagger or len(text.split()) <= 3:
             return self._fallback_punctuation(text)
         
         try:
-            text = text.strip()
-            
-            # Check if text already has ending punctuation
-            if text and text[-1] in '.!?,;:':
-                return text
-            
             # Tokenize into words
             tokens = word_tokenize(text.lower())
             
@@ -176,7 +473,7 @@ class RealTimeTranslator:
             if has_question_word or (starts_with_verb and len(tokens) > 2):
                 # Likely a question
                 text += '?'
-            elif any(token in ['wow', 'excellent', 'amazing', 'incredible', 'unbelievable'] for token, _ in pos_tags):
+            elif self._emphatic_word_re.search(text):
                 # Emphatic statements
                 text += '!'
             else:
@@ -196,21 +493,37 @@ class RealTimeTranslator:
             return self._fallback_punctuation(text)
     
     def _fallback_punctuation(self, text):
-        """Fallback punctuation method for when NLTK is not available"""
+        """Rule-based punctuation for when the POS tagger is not used"""
         if not text or text[-1] in '.!?,;:':
             return text
         
-        # Simple question detection
-        question_words = ['what', 'when', 'where', 'who', 'why', 'how', 'is', 'are', 'do', 'does', 
-                         'can', 'could', 'will', 'would', 'should', 'have', 'has', 'did', 'do']
-        
-        first_word = text.split()[0].lower() if text.split() else ""
-        
-        if first_word in question_words:
+        # Simple question detection on the first word
+        if self._question_start_re.match(text.lstrip()):
             return text + '?'
+        elif self._emphatic_word_re.search(text):
+            return text + '!'
         else:
             return text + '.'
         
+    @staticmethod
+    def resolve_whisper_device(device):
+        """Map the whisper_device setting to cpu/cuda ('auto' uses CUDA when available)"""
+        device = device.strip().lower()
+        if device == 'gpu':
+            return 'cuda'
+        if device != 'auto':
+            return device
+        
+        try:
+            import torch
+            return 'cuda' if torch.cuda.is_available() else 'cpu'
+        except ImportError:
+            pass
+        if FASTER_WHISPER_AVAILABLE:
+            import ctranslate2
+            return 'cuda' if ctranslate2.get_cuda_device_count() > 0 else 'cpu'
+        return 'cpu'
+    
     def improve_recognition_accuracy(self, audio):
         """
         Try multiple recognition methods with fallback for better accuracy
@@ -218,6 +531,7 @@ class RealTimeTranslator:
         
         Supports:
         - Whisper (better for French and multilingual)
+        - Vosk (offline, runs on CPU without any network round trip)
         - Google Speech Recognition (free fallback)
         """
         recognized_text = None
@@ -235,12 +549,22 @@ class RealTimeTranslator:
                         print(f"[DEBUG] Whisper recognition error: {e}")
                     # Fall through to Google
             
+            # Vosk (offline, no audio upload)
+            if self.recognition_service == 'vosk' and VOSK_AVAILABLE and self._vosk_error is None:
+                try:
+                    recognized_text, best_score = self._recognize_with_vosk(audio)
+                    if recognized_text:
+                        return recognized_text, best_score
+                except Exception as e:
+                    if self.debug_mode:
+                        print(f"[DEBUG] Vosk recognition error: {e}")
+                    # Fall through to Google
+            
             # Method 2: Google Speech Recognition (fallback)
             try:
-                language_code = f"{self.from_lang}-{self.from_lang.upper()}"
                 recognized_text = self.recognizer.recognize_google(
                     audio,
-                    language=language_code,
+                    language=self.recognition_lang,
                     show_all=False
                 )
                 best_score = 0.8  # Baseline confidence
@@ -274,52 +598,153 @@ class RealTimeTranslator:
             return None, 0
         
         try:
-            # Load model if not already loaded
-            if self.whisper_processor is None:
-                if self.debug_mode:
-                    print(f"[DEBUG] Loading Whisper model: {self.whisper_model}")
-                self.whisper_processor = whisper.load_model(
-                    self.whisper_model,
-                    device=self.whisper_device
-                )
+            self._load_whisper_model()
             
-            # Convert audio to wav format for Whisper
-            audio_data = audio.get_wav_data()
+            # Whisper takes 16 kHz mono float32 samples directly, so no temp file
+            # or ffmpeg decode is needed (numpy is a dependency of both backends)
+            raw = audio.get_raw_data(convert_rate=self.WHISPER_SAMPLE_RATE, convert_width=2)
+            pcm = np.frombuffer(raw, dtype=np.int16)
             
-            # Create temporary wav file
-            import tempfile
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                temp_file.write(audio_data)
-                temp_path = temp_file.name
-            
-            try:
+            with self._pcm_lock:
+                # Normalize straight into the reused buffer instead of allocating new arrays
+                if self._pcm_buf is None or len(self._pcm_buf) < len(pcm):
+                    self._pcm_buf = np.empty(max(len(pcm), self.WHISPER_SAMPLE_RATE * 30), dtype=np.float32)
+                samples = self._pcm_buf[:len(pcm)]
+                np.divide(pcm, 32768.0, out=samples, dtype=np.float32)
+                
                 # Transcribe with Whisper
                 if self.debug_mode:
                     print(f"[DEBUG] Transcribing with Whisper ({self.from_lang})...")
                 
-                result = self.whisper_processor.transcribe(
-                    temp_path,
-                    language=self.from_lang,
-                    fp16=False  # Set to True if GPU available
-                )
-                
-                # Whisper returns dict with "text" key containing transcribed text
-                recognized_text = result.get("text", "").strip() if isinstance(result, dict) else str(result).strip()
-                
-                if self.debug_mode:
-                    print(f"[DEBUG] Whisper recognition successful: {recognized_text}")
-                
-                return recognized_text, 0.9
+                if FASTER_WHISPER_AVAILABLE:
+                    segments, _ = self.whisper_processor.transcribe(
+                        samples,
+                        language=self.from_lang,
+                        beam_size=1,
+                        initial_prompt=self._whisper_prompt
+                    )
+                    # Segments are decoded lazily, so consume them while the buffer is held
+                    recognized_text = "".join(segment.text for segment in segments).strip()
+                else:
+                    result = self.whisper_processor.transcribe(
+                        samples,
+                        language=self.from_lang,
+                        fp16=self.whisper_device == "cuda",  # Half precision only helps on GPU
+                        initial_prompt=self._whisper_prompt
+                    )
+                    
+                    # Whisper returns dict with "text" key containing transcribed text
+                    recognized_text = result.get("text", "").strip() if isinstance(result, dict) else str(result).strip()
                 
-            finally:
-                # Clean up temp file
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
+                # The end of this phrase gives the next one context, so a sentence split
+                # across two captures is still transcribed consistently (updated under the
+                # lock so the next transcription always sees the one before it)
+                if recognized_text:
+                    self._whisper_prompt = recognized_text[-self.WHISPER_PROMPT_CHARS:]
+            
+            if self.debug_mode:
+                print(f"[DEBUG] Whisper recognition successful: {recognized_text}")
+            
+            return recognized_text, 0.9
         
         except Exception as e:
             if self.debug_mode:
                 print(f"[DEBUG] Whisper error: {e}")
             return None, 0
+    
+    def _load_whisper_model(self):
+        """Load the Whisper model if not already loaded (only once, even with several threads)"""
+        with self._whisper_lock:
+            if self.whisper_processor is not None:
+                return
+            if self.debug_mode:
+                print(f"[DEBUG] Loading Whisper model: {self.whisper_model}")
+            if FASTER_WHISPER_AVAILABLE:
+                self.whisper_processor = WhisperModel(
+                    self.whisper_model,
+                    device=self.whisper_device,
+                    compute_type=self.whisper_compute_type
+                )
+            else:
+                self.whisper_processor = whisper.load_model(
+                    self.whisper_model,
+                    device=self.whisper_device
+                )
+    
+    def _load_vosk_model(self):
+        """Load the Vosk model if not already loaded (only once, even with several threads)"""
+        with self._vosk_lock:
+            if self.vosk_model is not None:
+                return
+            if self._vosk_error is not None:
+                raise RuntimeError(self._vosk_error)
+            
+            model_name = self.vosk_model_path or vosk_language(self.from_lang)
+            if self.debug_mode:
+                print(f"[DEBUG] Loading Vosk model: {model_name}")
+            try:
+                if self.vosk_model_path:
+                    self.vosk_model = vosk.Model(model_path=self.vosk_model_path)
+                else:
+                    # Downloads the small model for the language on first use
+                    self.vosk_model = vosk.Model(lang=model_name)
+            except (Exception, SystemExit) as e:
+                # vosk calls sys.exit() when no model exists for the language;
+                # remember the failure so every later phrase goes straight to Google
+                self._vosk_error = f"Vosk model {model_name!r} could not be loaded ({e!r})"
+                print(f"{self._vosk_error}, using Google recognition")
+                raise RuntimeError(self._vosk_error)
+    
+    def _warmup(self):
+        """Preload the models used on every phrase (runs in background thread)"""
+        try:
+            if self._use_pos_tagger:
+                # Loads the tokenizer and tagger data from disk
+                pos_tag(word_tokenize("warm up the punctuation tagger"))
+            
+            if self.recognition_service == 'whisper' and WHISPER_AVAILABLE:
+                self._load_whisper_model()
+                
+                # One second of silence initializes the inference kernels
+                # (under the same lock as recognition: one transcription at a time)
+                silence = np.zeros(self.WHISPER_SAMPLE_RATE, dtype=np.float32)
+                with self._pcm_lock:
+                    if FASTER_WHISPER_AVAILABLE:
+                        segments, _ = self.whisper_processor.transcribe(silence, language=self.from_lang, beam_size=1)
+                        list(segments)  # Segments are generated lazily
+                    else:
+                        self.whisper_processor.transcribe(silence, language=self.from_lang,
+                                                          fp16=self.whisper_device == "cuda")
+            
+            if self.recognition_service == 'vosk' and VOSK_AVAILABLE:
+                self._load_vosk_model()
+            
+            if self.debug_mode:
+                print("[DEBUG] Model warm-up complete")
+        except Exception as e:
+            if self.debug_mode:
+                print(f"[DEBUG] Model warm-up failed: {e}")
+    
+    def _recognize_with_vosk(self, audio):
+        """
+        Recognize speech locally using a Vosk model
+        Nothing is uploaded, so latency is just CPU inference time
+        
+        Returns tuple of (text, confidence_score)
+        """
+        self._load_vosk_model()
+        
+        # Recognizers are cheap and not thread-safe, so use one per phrase
+        recognizer = vosk.KaldiRecognizer(self.vosk_model, self.VOSK_SAMPLE_RATE)
+        recognizer.AcceptWaveform(audio.get_raw_data(convert_rate=self.VOSK_SAMPLE_RATE, convert_width=2))
+        result = recognizer.FinalResult()
+        result = orjson.loads(result) if ORJSON_AVAILABLE else json.loads(result)
+        recognized_text = result.get('text', '').strip()
+        
+        if self.debug_mode:
+            print(f"[DEBUG] Vosk recognition successful: {recognized_text}")
+        
+        return recognized_text, 0.85
         
     def filter_recognition_noise(self, text):
         """
@@ -329,32 +754,33 @@ class RealTimeTranslator:
         if not text:
             return text
         
-        # Common noise patterns to remove or fix
-        noise_patterns = {
-            'inaudible': '',
-            'music': '',
-            '[background noise]': '',
-            '[silence]': '',
-            '[cough]': '',
-        }
-        
-        result = text
-        for pattern, replacement in noise_patterns.items():
-            result = result.replace(pattern, replacement)
-        
-        # Clean up extra spaces
-        result = ' '.join(result.split())
-        
-        return result
+        # Remove common noise patterns and clean up extra spaces
+        return ' '.join(NOISE_RE.sub('', text).split())
         
+    def _check_sample_rate(self):
+        """Fall back to the device default rate if the microphone can't capture at the configured one"""
+        if not self.sample_rate:
+            return
+        try:
+            with self.microphone:
+                pass
+        except OSError as e:
+            print(f"Microphone can't capture at {self.sample_rate} Hz ({e}), using the device default rate")
+            self.sample_rate = 0
+            self.microphone = sr.Microphone(chunk_size=self.chunk_size)
+    
     def setup_microphone(self):
         """Setup and calibrate microphone"""
+        self._check_sample_rate()
         print(f"Calibrating microphone for ambient noise ({self.ambient_duration}s)...")
         print("Please remain quiet during calibration...")
         
         with self.microphone as source:
             # Adjust for ambient noise with longer duration for better accuracy
-            self.recognizer.adjust_for_ambient_noise(source, duration=self.ambient_duration)
+            if NUMPY_AVAILABLE and source.SAMPLE_WIDTH == 2:
+                self._calibrate_energy_threshold(source)
+            else:
+                self.recognizer.adjust_for_ambient_noise(source, duration=self.ambient_duration)
             
             # Set manual energy threshold if configured, otherwise use auto-adjusted
             if self.energy_threshold > 0:
@@ -375,6 +801,23 @@ class RealTimeTranslator:
         print(f"Pause threshold: {self.pause_threshold}s (silence before ending phrase)")
         print(f"Non-speaking duration: {self.non_speaking_duration}s (minimum silence to end)")
     
+    def _calibrate_energy_threshold(self, source):
+        """
+        Set the energy threshold from ambient noise with one vectorized pass
+        Records ambient_duration seconds, then puts the threshold a margin above the loudest 5% of chunks
+        """
+        chunk_count = max(1, int(self.ambient_duration * source.SAMPLE_RATE / source.CHUNK))
+        raw = b"".join(source.stream.read(source.CHUNK) for _ in range(chunk_count))
+        
+        # One row per chunk, matching the chunk-by-chunk energy check in listen()
+        frames = np.frombuffer(raw, dtype=np.int16)
+        frames = frames[:len(frames) // source.CHUNK * source.CHUNK].reshape(-1, source.CHUNK)
+        chunk_rms = np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+        
+        # Same margin over ambient noise as SpeechRecognition's own calibration (1.5x),
+        # so noise alone doesn't start phrases
+        self.recognizer.energy_threshold = float(np.percentile(chunk_rms, 95)) * self.recognizer.dynamic_energy_ratio
+    
     def show_voice_log_info(self):
         """Show information about voice logging"""
         if self.voice_logger.voice_log_enabled:
@@ -387,48 +830,146 @@ class RealTimeTranslator:
         
     def translate_text(self, text):
         """Translate text using Azure Translator API"""
-        if not self.azure_key:
-            if self.fallback_mode == 'show_original':
-                return f"[NO API KEY] {text}"
-            elif self.fallback_mode == 'show_error':
-                return "[TRANSLATION ERROR: No API Key]"
-            else:
-                return "[NEEDS TRANSLATION]"
-            
-        path = '/translate'
-        constructed_url = self.azure_endpoint + path
-
-        params = {
-            'api-version': self.api_version,
-            'from': self.from_lang,
-            'to': [self.to_lang]
-        }
-
-        headers = {
-            'Ocp-Apim-Subscription-Key': self.azure_key,
-            'Ocp-Apim-Subscription-Region': self.azure_region,
-            'Content-type': 'application/json',
-            'X-ClientTraceId': str(uuid.uuid4())
-        }
-
-        body = [{'text': text}]
-
+        return self._resolve_translation(text, self._translate_async(text))
+    
+    def _resolve_translation(self, text, future):
+        """Wait for a translation future, turning failures into the configured fallback text"""
         try:
-            request = requests.post(constructed_url, params=params, headers=headers, 
-                                  json=body, timeout=self.timeout)
-            response = request.json()
-            
-            if request.status_code == 200 and response:
-                return response[0]['translations'][0]['text']
-            else:
-                if self.debug_mode:
-                    print(f"Translation error: {request.status_code} - {response}")
-                return self.handle_translation_error(text, f"HTTP {request.status_code}")
-                
+            return future.result(timeout=self._result_timeout)
+        except Exception as e:
+            if self.debug_mode:
+                print(f"Azure API error: {e!r}")
+            return self.handle_translation_error(text, str(e) or type(e).__name__)
+    
+    def _completed(self, result):
+        """Wrap an already known translation in a finished Future"""
+        future = Future()
+        future.set_result(result)
+        return future
+    
+    def _translate_without_key(self, text):
+        """Demo mode placeholder used when no Azure key is configured"""
+        if self.fallback_mode == 'show_original':
+            return self._completed(f"[NO API KEY] {text}")
+        elif self.fallback_mode == 'show_error':
+            return self._completed("[TRANSLATION ERROR: No API Key]")
+        else:
+            return self._completed("[NEEDS TRANSLATION]")
+    
+    def _request_translation(self, text):
+        """Queue the text for Azure; concurrent phrases are sent together in one request"""
+        return self.batcher.submit(text)
+    
+    def _translate_cached(self, text):
+        """Answer repeated phrases from the cache, requesting only on a miss"""
+        cache_key = (self.from_lang, self.to_lang, text.strip().lower())
+        translated_text = self._get_cached_translation(cache_key)
+        if translated_text is not None:
+            return self._completed(translated_text)
+        
+        def store(future):
+            # Failures and cancellations are never cached
+            if not future.cancelled() and future.exception() is None:
+                self._cache_translation(cache_key, future.result())
+        
+        future = self._request_translation(text)
+        future.add_done_callback(store)
+        return future
+    
+    def _get_cached_translation(self, cache_key):
+        """Return a cached translation (marking it recently used), or None"""
+        with self._cache_lock:
+            translated_text = self._translation_cache.get(cache_key)
+            if translated_text is not None:
+                self._translation_cache.move_to_end(cache_key)
+            return translated_text
+    
+    def _cache_translation(self, cache_key, translated_text):
+        """Store a translation, evicting the least recently used entry when full"""
+        with self._cache_lock:
+            self._translation_cache[cache_key] = translated_text
+            self._translation_cache.move_to_end(cache_key)
+            while len(self._translation_cache) > self.cache_size:
+                self._translation_cache.popitem(last=False)
+    
+    def _warm_up_connection(self):
+        """
+        Make the TCP/TLS handshake before the first phrase (runs in background thread)
+        The pooled connection is then reused, so the first translation pays no setup cost
+        """
+        try:
+            # The languages list needs no authentication and is served by the same host
+            self.http.get(self.azure_endpoint.rstrip('/') + '/languages',
+                          params={'api-version': self.api_version, 'scope': 'translation'},
+                          timeout=self.timeout)
+            if self.use_token_auth:
+                self._auth_token()
         except Exception as e:
             if self.debug_mode:
-                print(f"Azure API error: {e}")
-            return self.handle_translation_error(text, str(e))
+                print(f"[DEBUG] Connection warm-up failed: {e}")
+    
+    def _auth_token(self):
+        """Return the cached Azure access token, fetching a new one when it is about to expire"""
+        if time.time() < self._token_exp - 30:
+            return self._token
+        
+        with self._token_lock:
+            # Another thread may have refreshed the token while we waited for the lock
+            if time.time() >= self._token_exp - 30:
+                response = self.http.post(self._token_url,
+                                          headers={'Ocp-Apim-Subscription-Key': self.azure_key},
+                                          timeout=self.timeout)
+                response.raise_for_status()
+                self._token = response.text
+                self._token_exp = time.time() + self.TOKEN_LIFETIME
+            return self._token
+    
+    def _invalidate_token(self):
+        """Force the next request to fetch a fresh access token"""
+        with self._token_lock:
+            self._token_exp = 0
+    
+    def _next_trace_id(self):
+        """Return a unique 32-hex-digit trace id for the next request"""
+        return f"{self._trace_prefix}{next(self._trace_counter) & 0xFFFFFFFF:08x}"
+    
+    def _translate_batch(self, texts):
+        """Translate a list of texts with a single Azure Translator request"""
+        # Content-type (and key auth) headers are set on the session;
+        # a trace id is only useful when debugging (Azure generates one otherwise)
+        headers = {'X-ClientTraceId': self._next_trace_id()} if self.debug_mode else {}
+        if self.use_token_auth:
+            headers['Authorization'] = f"Bearer {self._auth_token()}"
+        body = [{'text': text} for text in texts]
+        if ORJSON_AVAILABLE:
+            body = orjson.dumps(body)
+        
+        request = self._post_translation(body, headers)
+        
+        # An expired or revoked token gets one refresh and retry
+        if self.use_token_auth and request.status_code in (401, 403):
+            self._invalidate_token()
+            headers['Authorization'] = f"Bearer {self._auth_token()}"
+            request = self._post_translation(body, headers)
+        
+        # Only successful responses are parsed; errors just report the status code
+        if request.status_code != 200:
+            if self.debug_mode:
+                print(f"Translation error: {request.status_code} - {request.text}")
+            if request.status_code in TEXT_REJECTED_STATUSES:
+                raise TextRejectedError(f"HTTP {request.status_code}", response=request)
+            raise requests.HTTPError(f"HTTP {request.status_code}", response=request)
+        
+        response = orjson.loads(request.content) if ORJSON_AVAILABLE else request.json()
+        return [item['translations'][0]['text'] for item in response]
+    
+    def _post_translation(self, body, headers):
+        """Send a translate request (body is pre-serialized bytes when orjson is available)"""
+        if ORJSON_AVAILABLE:
+            return self.http.post(self._translate_url, params=self._translate_params, headers=headers,
+                                  data=body, timeout=self.timeout)
+        return self.http.post(self._translate_url, params=self._translate_params, headers=headers,
+                              json=body, timeout=self.timeout)
     
     def handle_translation_error(self, original_text, error):
         """Handle translation errors based on fallback mode"""
@@ -442,52 +983,153 @@ class RealTimeTranslator:
     def write_to_file(self, text):
         """Write translation to OBS buffer and log file"""
         try:
+            text = text.strip()
+            if not text:
+                return
+            
             # Add to OBS buffer (handles multi-line display and auto-clear)
-            if text.strip():
-                self.obs_buffer.add_text(text)
-            
-            # Write to log file if configured
-            if self.log_file and text.strip():
-                # Add timestamp for log file
-                if self.include_timestamp:
-                    timestamp = datetime.now().strftime(self.timestamp_format)
-                    log_text = f"{timestamp} {text}"
-                else:
-                    log_text = text
-                    
-                with open(self.log_file, 'a', encoding=self.encoding) as f:
-                    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    f.write(f"[{timestamp}] {log_text}\n")
+            self.obs_buffer.add_text(text)
+            
+            # Write to log file if configured (each line carries its own timestamp)
+            if self._log_fd is not None:
+                line = f"[{self._log_timestamp()}] {text}\n".encode(self.encoding)
+                os.write(self._log_fd, line)
                     
         except Exception as e:
             print(f"File write error: {e}")
     
+    def _log_timestamp(self):
+        """Return the log line timestamp, formatting it at most once per second"""
+        now = int(time.time())
+        second, text = self._log_ts
+        if now != second:
+            text = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))
+            self._log_ts = (now, text)
+        return text
+    
     def listen_continuously(self):
         """Continuously listen for speech in a separate thread"""
         print(f"Continuous listening enabled: {self.from_lang_name} -> {self.to_lang_name}")
         print("Press Ctrl+C to stop...")
         
-        while self.is_running:
-            try:
-                # Listen for audio with timeout
-                with self.microphone as source:
+        if self.use_azure_speech:
+            if self.listen_with_azure_speech():
+                return
+            
+            # Azure Speech stopped with an error: continue with the microphone and Google
+            print("Azure Speech unavailable, falling back to Google recognition")
+            self.use_azure_speech = False
+            self.setup_microphone()
+        
+        # Error backoff: doubles on each consecutive failure, reset after a successful listen
+        backoff = self.MIN_ERROR_BACKOFF
+        
+        # Keep the microphone stream open for the whole session
+        with self.microphone as source:
+            while self.is_running:
+                try:
+                    # Listen for audio with timeout
                     audio = self.recognizer.listen(source, 
                                                  timeout=self.listen_timeout, 
                                                  phrase_time_limit=self.phrase_time_limit)
-                
-                # Process in background thread to avoid blocking
-                if self.config.getboolean('Performance', 'use_background_processing'):
-                    threading.Thread(target=self.process_audio, args=(audio,), daemon=True).start()
-                else:
-                    self.process_audio(audio)
-                
-            except sr.WaitTimeoutError:
-                # Normal timeout, continue listening
+                    backoff = self.MIN_ERROR_BACKOFF
+                    
+                    # Process in background thread to avoid blocking
+                    if self.use_background_processing:
+                        self.submit_background(self.process_audio, audio)
+                    else:
+                        self.process_audio(audio)
+                    
+                except sr.WaitTimeoutError:
+                    # Normal timeout, continue listening
+                    pass
+                except Exception as e:
+                    if self.debug_mode:
+                        print(f"Listen error: {e}")
+                    # Exponential backoff with jitter instead of a fixed 1s pause
+                    time.sleep(backoff + random.random() * self.MIN_ERROR_BACKOFF)
+                    backoff = min(backoff * 2, self.MAX_ERROR_BACKOFF)
+    
+    def listen_with_azure_speech(self):
+        """
+        Stream microphone audio to Azure Speech over one persistent connection
+        Recognized phrases are delivered as events instead of per-phrase uploads
+        
+        Returns False if the SDK stopped recognition on its own (e.g. wrong key or region)
+        """
+        speech_config = speechsdk.SpeechConfig(subscription=self.azure_speech_key,
+                                               region=self.azure_speech_region)
+        speech_config.speech_recognition_language = self.recognition_lang
+        audio_config = speechsdk.audio.AudioConfig(use_default_microphone=True)
+        speech_recognizer = speechsdk.SpeechRecognizer(speech_config=speech_config,
+                                                       audio_config=audio_config)
+        speech_recognizer.recognized.connect(self._on_azure_speech_recognized)
+        
+        # Cancellation (bad key, wrong region, network) ends the session inside the SDK
+        session_ended = threading.Event()
+        
+        def on_canceled(evt):
+            if evt.reason == speechsdk.CancellationReason.Error:
+                print(f"Azure Speech error: {evt.cancellation_details.error_details} "
+                      f"(region: {self.azure_speech_region})")
+            elif self.debug_mode:
+                print(f"[DEBUG] Azure Speech canceled: {evt.reason}")
+            session_ended.set()
+        
+        def on_session_stopped(evt):
+            if self.debug_mode:
+                print("[DEBUG] Azure Speech session stopped")
+            session_ended.set()
+        
+        speech_recognizer.canceled.connect(on_canceled)
+        speech_recognizer.session_stopped.connect(on_session_stopped)
+        
+        speech_recognizer.start_continuous_recognition()
+        try:
+            while self.is_running and not session_ended.wait(0.1):
                 pass
-            except Exception as e:
-                if self.debug_mode:
-                    print(f"Listen error: {e}")
-                time.sleep(1)
+        finally:
+            speech_recognizer.stop_continuous_recognition()
+        
+        # Still running means the SDK ended the session, not the user
+        return not self.is_running
+    
+    def _on_azure_speech_recognized(self, evt):
+        """Handle a final recognition result from Azure Speech"""
+        if evt.result.reason != speechsdk.ResultReason.RecognizedSpeech or not evt.result.text:
+            return
+        
+        # Process in background thread to keep the SDK event thread free
+        if self.use_background_processing:
+            self.submit_background(self.process_recognized_text, evt.result.text)
+        else:
+            self.process_recognized_text(evt.result.text)
+    
+    def submit_background(self, func, item):
+        """
+        Run func(item) on the worker pool
+        Drops the oldest waiting phrase if too many are queued, so processing never lags far behind speech
+        """
+        with self._pending_lock:
+            full = len(self._pending_items) == self._pending_items.maxlen
+            self._pending_items.append((func, item))
+        
+        if full:
+            # The dropped phrase's pool task picks up the new one instead
+            if self.debug_mode:
+                print(f"[DEBUG] {self._pending_items.maxlen} phrases pending, dropped the oldest")
+            return
+        
+        # One pool task per waiting phrase
+        self._pool.submit(self._run_next_pending)
+    
+    def _run_next_pending(self):
+        """Process the oldest waiting phrase (runs in a pool worker)"""
+        with self._pending_lock:
+            if not self._pending_items or not self.is_running:
+                return  # Cleared by stop()
+            func, item = self._pending_items.popleft()
+        func(item)
     
     def process_audio(self, audio):
         """Process audio in background thread with improved recognition and punctuation"""
@@ -498,21 +1140,56 @@ class RealTimeTranslator:
             if not original_text:
                 return  # No speech detected
             
+            self.process_recognized_text(original_text)
+            
+        except sr.UnknownValueError:
+            # No speech detected, this is normal
+            pass
+        except sr.RequestError as e:
+            if self.debug_mode:
+                print(f"Google Speech error: {e}")
+        except Exception as e:
+            if self.debug_mode:
+                print(f"Processing error: {e}")
+    
+    def process_recognized_text(self, original_text):
+        """Clean up, log and display a recognized phrase, then queue it for translation"""
+        try:
             # Filter out noise patterns
             original_text = self.filter_recognition_noise(original_text)
             
             # Restore punctuation using NLTK
             original_text = self.restore_punctuation(original_text)
             
+            # Start translating right away so the request is in flight while we log and print
+            future = self._translate_async(original_text)
+            
             # Log original text to daily voice log
             self.voice_logger.log_original_text(original_text, self.original_prefix.rstrip(':'))
             
             if self.show_original:
                 print(f"{self.original_prefix} {original_text}")
             
-            # Translate to target language
-            translated_text = self.translate_text(original_text)
+            # Hand over to the output thread (blocks if it is far behind)
+            self._text_q.put((original_text, future))
+            
+        except Exception as e:
+            if self.debug_mode:
+                print(f"Processing error: {e}")
+    
+    def _translation_worker(self):
+        """Write translations in the order their phrases were recognized (runs in its own thread)"""
+        while True:
+            item = self._text_q.get()
+            if item is None:
+                break  # Stop signal; phrases queued before it are still written
             
+            original_text, future = item
+            self.output_translation(self._resolve_translation(original_text, future))
+    
+    def output_translation(self, translated_text):
+        """Display a translation and update the OBS and log files"""
+        try:
             if self.show_translation:
                 print(f"{self.translation_prefix} {translated_text}")
             
@@ -520,12 +1197,6 @@ class RealTimeTranslator:
             self.write_to_file(translated_text)
             self.last_translation = translated_text
             
-        except sr.UnknownValueError:
-            # No speech detected, this is normal
-            pass
-        except sr.RequestError as e:
-            if self.debug_mode:
-                print(f"Google Speech error: {e}")
         except Exception as e:
             if self.debug_mode:
                 print(f"Processing error: {e}")
@@ -540,6 +1211,9 @@ class RealTimeTranslator:
         
         if not self.azure_key:
             print("Demo mode (no Azure API key)")
+        else:
+            # Open the Azure connection while the microphone starts up
+            threading.Thread(target=self._warm_up_connection, daemon=True).start()
         
         try:
             self.listen_continuously()
@@ -550,12 +1224,34 @@ class RealTimeTranslator:
         """Stop the real-time translation"""
         self.is_running = False
         
+        # Drop phrases still waiting for a worker, so their queued pool tasks return
+        # at once instead of keeping the process alive at exit; then stop accepting work
+        with self._pending_lock:
+            self._pending_items.clear()
+        self._pool.shutdown(wait=False)
+        
+        # Let the translation thread write what is already queued, then stop it
+        try:
+            self._text_q.put(None, timeout=1)
+            self._translation_thread.join(timeout=self.timeout)
+        except queue.Full:
+            pass
+        
         # Finalize daily voice log
         self.voice_logger.finalize_daily_log()
         
         # Clean up OBS buffer
         self.obs_buffer.cleanup()
         
+        # Stop the translation batcher and close pooled HTTP connections
+        self.batcher.close()
+        self.http.close()
+        
+        # Close the translation log
+        if self._log_fd is not None:
+            log_fd, self._log_fd = self._log_fd, None
+            os.close(log_fd)
+        
         # Show final stats
         if self.voice_logger.voice_log_enabled:
             stats = self.voice_logger.get_today_stats()
@@ -4,7 +4,9 @@ Handles logging of original voice recordings to daily files
 """
 
 import os
-from datetime import datetime
+import queue
+import threading
+from datetime import datetime, timedelta
 from pathlib import Path
 
 
@@ -17,16 +19,38 @@ class VoiceLogger:
         self.voice_log_directory = self.config.get('Output', 'voice_log_directory')
         self.encoding = self.config.get('Output', 'encoding')
         
+        self.current_date = None
+        self.current_log_file = ""
+        self._next_midnight = None  # current_log_file is valid until then
+        
+        # Today's file stays open for the writer thread (reopened when the date changes)
+        self._log_fh = None
+        self._log_fh_path = None
+        
+        # (path, mtime, size) -> entry count from the last stats scan
+        self._stats_key = None
+        self._stats_lines = 0
+        
+        # Lines are written by a background thread so logging never blocks on disk
+        self._write_q = queue.Queue()
+        self._writer = None
+        
         # Create voice log directory if it doesn't exist
         if self.voice_log_enabled:
             Path(self.voice_log_directory).mkdir(exist_ok=True)
+            self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+            self._writer.start()
         
-        self.current_date = None
-        self.current_log_file = ""
+    def _get_current_log_file(self, now=None):
+        """Get the log file path for the given time (default: now)"""
+        now = now or datetime.now()
+        
+        # The path only changes at midnight, so skip formatting the date until then
+        if self._next_midnight is not None and now < self._next_midnight:
+            return self.current_log_file
         
-    def _get_current_log_file(self):
-        """Get the current log file path based on today's date"""
-        today = datetime.now().strftime('%Y-%m-%d')
+        today = now.strftime('%Y-%m-%d')
+        self._next_midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
         
         # Check if we need to create a new log file (date changed)
         if self.current_date != today:
@@ -57,18 +81,61 @@ class VoiceLogger:
         if not self.voice_log_enabled or not original_text.strip():
             return
         
-        try:
-            log_file = self._get_current_log_file()
-            timestamp = datetime.now().strftime('%H:%M:%S')
+        # Queue the line; the writer thread appends it to the file for its date
+        now = datetime.now()
+        self._write_q.put((now, f"[{now.strftime('%H:%M:%S')}] {language_prefix}: {original_text}\n"))
+    
+    def _writer_loop(self):
+        """Append queued lines to the voice log (runs in background thread)"""
+        while True:
+            batch = [self._write_q.get()]
             
-            with open(log_file, 'a', encoding=self.encoding) as f:
-                f.write(f"[{timestamp}] {language_prefix}: {original_text}\n")
-                
-        except Exception as e:
-            print(f"Error writing voice log: {e}")
+            # Take everything else already queued so a burst costs one file open
+            while True:
+                try:
+                    batch.append(self._write_q.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                self._write_batch(batch)
+            except Exception as e:
+                print(f"Error writing voice log: {e}")
+            finally:
+                for _ in batch:
+                    self._write_q.task_done()
+    
+    def _write_batch(self, batch):
+        """Write (time, line) entries to the open daily file, switching files at midnight"""
+        try:
+            for when, line in batch:
+                log_file = self._get_current_log_file(when)
+                if log_file != self._log_fh_path:
+                    self._close_log_file()
+                    self._log_fh = open(log_file, 'a', encoding=self.encoding)
+                    self._log_fh_path = log_file
+                self._log_fh.write(line)
+        finally:
+            # One flush per batch keeps the file readable for stats
+            if self._log_fh:
+                self._log_fh.flush()
+    
+    def _close_log_file(self):
+        """Close the daily file held open by the writer thread"""
+        if self._log_fh:
+            self._log_fh.close()
+        self._log_fh = None
+        self._log_fh_path = None
+    
+    def flush(self):
+        """Wait until every queued line has been written"""
+        if self._writer:
+            self._write_q.join()
     
     def finalize_daily_log(self):
         """Add end timestamp when stopping the application"""
+        self.flush()
+        self._close_log_file()
         if not self.voice_log_enabled or not self.current_log_file:
             return
         
@@ -83,22 +150,34 @@ class VoiceLogger:
         if not self.voice_log_enabled:
             return None
         
+        self.flush()
         log_file = self._get_current_log_file()
         
         if not os.path.exists(log_file):
             return {"lines": 0, "file": log_file}
         
         try:
-            with open(log_file, 'r', encoding=self.encoding) as f:
-                lines = f.readlines()
-                # Count lines that contain actual voice logs (with timestamps)
-                voice_lines = [line for line in lines if line.startswith('[') and ']:' in line]
-                
+            stat = os.stat(log_file)
+            stats_key = (log_file, stat.st_mtime_ns, stat.st_size)
+            
+            # Rescan only when the file changed since the last call
+            if stats_key != self._stats_key:
+                self._stats_lines = self._count_entries(log_file)
+                self._stats_key = stats_key
+            
             return {
-                "lines": len(voice_lines),
+                "lines": self._stats_lines,
                 "file": log_file,
-                "size": os.path.getsize(log_file)
+                "size": stat.st_size
             }
         except Exception as e:
             print(f"Error reading voice log stats: {e}")
-            return None
\ No newline at end of file
+            return None
+    
+    @staticmethod
+    def _count_entries(log_file):
+        """Count voice log entries (lines starting with a [HH:MM:SS] timestamp)"""
+        # One C-level scan of the raw bytes instead of decoding the file into a list of lines
+        with open(log_file, 'rb') as f:
+            data = f.read()
+        return data.count(b'\n[') + (1 if data[:1] == b'[' else 0)